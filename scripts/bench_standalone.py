@@ -0,0 +1,213 @@
+import argparse
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * pct / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+def bench(name, fn, iterations, setup=None):
+    """
+    Runs fn() `iterations` times (after one warm-up call) and returns a dict
+    with ops/sec and per-call latency percentiles in milliseconds.
+    """
+    if setup: setup()
+    fn()
+    samples = []
+    total_start = time.perf_counter()
+    for _ in range(iterations):
+        if setup: setup()
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    elapsed = time.perf_counter() - total_start
+    samples.sort()
+    busy = sum(samples)
+    return {
+        "name": name,
+        "iterations": iterations,
+        "ops_per_sec": iterations / busy if busy else 0.0,
+        "wall_sec": elapsed,
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p90_ms": percentile(samples, 90) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+        "max_ms": samples[-1] * 1000,
+    }
+
+def check_conformance(standalone):
+    """
+    Checks the curve code against the RFC 8032 vectors and every available
+    signing backend against the pure-Python one.
+    """
+    ok = True
+    for i, (sk_hex, pk_hex, msg_hex, sig_hex) in enumerate(standalone.RFC8032_VECTORS, 1):
+        sk, msg, sig = bytes.fromhex(sk_hex), bytes.fromhex(msg_hex), bytes.fromhex(sig_hex)
+        pk = standalone.publickey(sk)
+        passed = (pk.hex() == pk_hex
+                  and standalone.signature(msg, sk, pk) == sig
+                  and standalone.checkvalid(sig, msg, pk)
+                  and not standalone.checkvalid(sig, msg + b"\x00", pk))
+        print(f"[{'+' if passed else '!'}] RFC 8032 test {i}: {'ok' if passed else 'FAILED'}")
+        ok = ok and passed
+
+    reference = standalone.PurePythonSigner(standalone.SK_SEED, standalone.PUBLIC_KEY_BYTES)
+    for name, cls in standalone.SIGNING_BACKENDS.items():
+        if name == reference.name:
+            continue
+        try:
+            signer = cls(standalone.SK_SEED, standalone.PUBLIC_KEY_BYTES)
+        except Exception as e:
+            print(f"[*] Backend {name} unavailable ({e.__class__.__name__})")
+            continue
+        passed = standalone.signer_selftest(signer, reference)
+        print(f"[{'+' if passed else '!'}] Backend {name} matches {reference.name}: {'ok' if passed else 'FAILED'}")
+        ok = ok and passed
+    return ok
+
+class BenchHandler:
+    """
+    Drives HytaleHandler route methods without a socket.
+    """
+    def __init__(self, standalone, token=None):
+        class Handler(standalone.HytaleHandler):
+            def log_message(self, format, *args):
+                pass
+        self.handler_class = Handler
+        self.token = token
+
+    def call(self, method_name, *args):
+        handler = self.handler_class.__new__(self.handler_class)
+        handler.wfile = io.BytesIO()
+        handler.request_version = "HTTP/1.1"
+        handler.requestline = method_name
+        handler.client_address = ("127.0.0.1", 0)
+        handler.command = "POST"
+        handler.close_connection = True
+        handler.headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
+        getattr(handler, method_name)(*args)
+        return handler.wfile.getvalue()
+
+def primitive_benchmarks(standalone, iterations):
+    signer = standalone.get_signer()
+    pure = standalone.PurePythonSigner(standalone.SK_SEED, standalone.PUBLIC_KEY_BYTES)
+    msg = b"eyJraWQiOiJlZDI1NTE5LWtleS0yMDI0In0.eyJzdWIiOiJiZW5jaCJ9"
+    sig = pure.sign(msg)
+    payload = {"sub": "bench", "username": "Bench", "iat": 0, "exp": 1893456000}
+    return [
+        bench("publickey", lambda: standalone.publickey(standalone.SK_SEED), iterations),
+        bench("signature (pure-python)", lambda: standalone.signature(msg, standalone.SK_SEED, standalone.PUBLIC_KEY_BYTES), iterations),
+        bench("checkvalid (pure-python)", lambda: standalone.checkvalid(sig, msg, standalone.PUBLIC_KEY_BYTES), iterations),
+        bench(f"sign ({signer.name})", lambda: signer.sign(msg), iterations),
+        bench(f"verify ({signer.name})", lambda: signer.verify(msg, sig), iterations),
+        bench("sign_jwt", lambda: standalone.sign_jwt(payload), iterations),
+        bench("sign_jwt_many x3", lambda: standalone.sign_jwt_many([payload] * 3), iterations),
+    ]
+
+def endpoint_benchmarks(standalone, iterations):
+    username = "Bench"
+    user_uuid = standalone.generate_uuid(username)
+    login = BenchHandler(standalone).call("handle_login", {"username": username})
+    token = json.loads(login.split(b"\r\n\r\n", 1)[1])["access_token"]
+    handler = BenchHandler(standalone, token)
+    anonymous = BenchHandler(standalone)
+    cold = standalone.TOKEN_CACHE.clear
+
+    routes = [
+        ("generate_game_tokens", lambda: standalone.generate_game_tokens(username, user_uuid)),
+        ("POST /launcher/login", lambda: anonymous.call("handle_login", {"username": username})),
+        ("GET /launcher/newsession", lambda: handler.call("handle_newsession")),
+        ("POST /game-session/refresh", lambda: handler.call("handle_session_refresh", {})),
+        ("POST /game-session/child", lambda: handler.call("handle_child_session", {"scopes": ["hytale:server"]})),
+        ("POST /game-session/new", lambda: anonymous.call("handle_new_game_session", {"uuid": user_uuid})),
+        ("POST /game-session/publicserver", lambda: anonymous.call("handle_public_server", {})),
+        ("POST /server-join/auth-token", lambda: anonymous.call("handle_auth_token", {"authorizationGrant": "bench", "x509Fingerprint": "bench"})),
+    ]
+    results = []
+    for name, fn in routes:
+        results.append(bench(f"{name} (cold cache)", fn, iterations, setup=cold))
+        results.append(bench(f"{name} (warm cache)", fn, iterations))
+    return results
+
+def startup_benchmarks(standalone, runs):
+    """
+    Times fresh interpreters importing standalone.py (in an empty working
+    directory) against bare interpreter startup.
+    """
+    scripts_dir = os.path.dirname(os.path.abspath(standalone.__file__))
+    importer = f"import sys; sys.path.insert(0, {scripts_dir!r}); import standalone"
+    with tempfile.TemporaryDirectory(prefix="hytale-bench-") as cwd:
+        def run(code):
+            return lambda: subprocess.run([sys.executable, "-c", code], cwd=cwd, check=True)
+        return [
+            bench("python -c pass", run("pass"), runs),
+            bench("python -c 'import standalone'", run(importer), runs),
+        ]
+
+def print_results(title, results):
+    print(f"\n=== {title} ===")
+    print(f"{'benchmark':<48} {'ops/sec':>10} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9}")
+    for r in results:
+        print(f"{r['name']:<48} {r['ops_per_sec']:>10.1f} {r['p50_ms']:>9.3f} {r['p90_ms']:>9.3f} {r['p99_ms']:>9.3f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline Ed25519/JWT benchmarks for standalone.py")
+    parser.add_argument("-n", "--iterations", type=int, default=200, help="Calls per benchmark (default: 200)")
+    parser.add_argument("--backend", default=None, help="Signing backend: auto, pure-python or cryptography")
+    parser.add_argument("--skip-endpoints", action="store_true", help="Only benchmark the primitives")
+    parser.add_argument("--startup-runs", type=int, default=10, help="Fresh interpreters to time for the startup benchmark, 0 to skip (default: 10)")
+    parser.add_argument("--json", dest="json_out", default=None, help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    if args.backend:
+        os.environ["HYTALE_SIGNING_BACKEND"] = args.backend
+    if args.json_out:
+        args.json_out = os.path.abspath(args.json_out)
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    # standalone.py keeps its launcher/ files relative to the working
+    # directory; run in a scratch one so the real profiles stay untouched
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="hytale-bench-") as workdir:
+        os.chdir(workdir)
+        try:
+            run(args)
+        finally:
+            os.chdir(cwd)
+
+def run(args):
+    import standalone
+
+    print("[*] Checking conformance...")
+    if not check_conformance(standalone):
+        print("[!] Conformance checks failed, not benchmarking")
+        sys.exit(1)
+    print(f"[*] Signing backend: {standalone.get_signer().name}")
+
+    report = {"python": sys.version.split()[0], "backend": standalone.get_signer().name}
+    report["primitives"] = primitive_benchmarks(standalone, args.iterations)
+    print_results("Primitives", report["primitives"])
+    if not args.skip_endpoints:
+        report["endpoints"] = endpoint_benchmarks(standalone, args.iterations)
+        print_results("Token-minting endpoints", report["endpoints"])
+    if args.startup_runs > 0:
+        report["startup"] = startup_benchmarks(standalone, args.startup_runs)
+        print_results("Startup", report["startup"])
+        import_ms = report["startup"][1]["p50_ms"] - report["startup"][0]["p50_ms"]
+        budget_ms = standalone.STARTUP_BUDGET * 1000
+        print(f"\n[{'+' if import_ms <= budget_ms else '!'}] Importing standalone.py takes {import_ms:.1f} ms (startup budget {budget_ms:.0f} ms)")
+
+    if args.json_out:
+        with open(args.json_out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n[+] Results written to {args.json_out}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+
+from bench_standalone import percentile
+
+FLOW_STEPS = [
+    "POST /launcher/login",
+    "GET /launcher/newsession",
+    "POST /game-session/child",
+    "POST /server-join/auth-grant",
+    "POST /server-join/auth-token",
+    "POST /game-session/refresh",
+]
+
+class StepError(Exception):
+    pass
+
+class FlowClient:
+    """
+    One keep-alive connection to the emulator, driving the client/server
+    join sequence and recording the latency of each step.
+    """
+    def __init__(self, host, port, timeout):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.conn = None
+
+    def close(self):
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
+    def request(self, method, path, body=None, token=None):
+        headers = {"Accept-Encoding": "identity"}
+        data = None
+        if body is not None:
+            data = json.dumps(body).encode()
+            headers["Content-Type"] = "application/json"
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        for attempt in range(2):
+            if self.conn is None:
+                self.conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            try:
+                self.conn.request(method, path, body=data, headers=headers)
+                resp = self.conn.getresponse()
+                raw = resp.read()
+                break
+            except (ConnectionError, http.client.HTTPException):
+                # The server closed an idle keep-alive connection; reconnect once
+                self.close()
+                if attempt:
+                    raise
+        if resp.will_close:
+            self.close()
+        if resp.status >= 400:
+            raise StepError(f"{method} {path} -> {resp.status}")
+        return json.loads(raw) if raw else {}
+
+    def run_flow(self, username, record):
+        def step(name, method, path, body=None, token=None):
+            start = time.perf_counter()
+            try:
+                result = self.request(method, path, body, token)
+            except Exception:
+                record(name, None)
+                raise
+            record(name, time.perf_counter() - start)
+            return result
+
+        login = step(FLOW_STEPS[0], "POST", "/launcher/login", {"username": username})
+        token = login["access_token"]
+        session = step(FLOW_STEPS[1], "GET", "/launcher/newsession", token=token)
+        step(FLOW_STEPS[2], "POST", "/game-session/child", {"scopes": ["hytale:server"]}, token=token)
+        grant = step(FLOW_STEPS[3], "POST", "/server-join/auth-grant",
+                     {"identityToken": session["identity_token"], "aud": "loadgen"})
+        step(FLOW_STEPS[4], "POST", "/server-join/auth-token",
+             {"authorizationGrant": grant["authorizationGrant"], "x509Fingerprint": "loadgen"})
+        step(FLOW_STEPS[5], "POST", "/game-session/refresh", {}, token=token)
+
+class Recorder:
+    def __init__(self):
+        self.samples = {name: [] for name in FLOW_STEPS}
+        self.errors = {name: 0 for name in FLOW_STEPS}
+        self.lock = threading.Lock()
+
+    def record(self, name, seconds):
+        with self.lock:
+            if seconds is None:
+                self.errors[name] += 1
+            else:
+                self.samples[name].append(seconds)
+
+def wait_for_server(host, port, timeout):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection(host, port, timeout=1)
+            conn.request("GET", "/launcher/info")
+            conn.getresponse().read()
+            conn.close()
+            return True
+        except OSError:
+            time.sleep(0.1)
+    return False
+
+def start_server(port, workdir, verbose):
+    """
+    Runs standalone.py's server in its own process so the load generator's
+    threads do not compete with it for the GIL.
+    """
+    scripts_dir = os.path.dirname(os.path.abspath(__file__))
+    code = (f"import sys; sys.path.insert(0, {scripts_dir!r}); import standalone; "
+            f"standalone.PORT = {port}; standalone.run_server()")
+    out = None if verbose else subprocess.DEVNULL
+    return subprocess.Popen([sys.executable, "-c", code], cwd=workdir, stdout=out, stderr=out)
+
+def run_load(host, port, users, flows, concurrency, timeout):
+    recorder = Recorder()
+    lock = threading.Lock()
+    next_flow = [0]
+    failed_flows = [0]
+
+    def worker():
+        client = FlowClient(host, port, timeout)
+        while True:
+            with lock:
+                n = next_flow[0]
+                if n >= flows:
+                    break
+                next_flow[0] += 1
+            try:
+                client.run_flow(f"LoadUser{n % users}", recorder.record)
+            except Exception:
+                client.close()
+                with lock:
+                    failed_flows[0] += 1
+        client.close()
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    steps = []
+    for name in FLOW_STEPS:
+        samples = sorted(recorder.samples[name])
+        steps.append({
+            "name": name,
+            "ok": len(samples),
+            "errors": recorder.errors[name],
+            "req_per_sec": len(samples) / elapsed if elapsed else 0.0,
+            "p50_ms": percentile(samples, 50) * 1000,
+            "p95_ms": percentile(samples, 95) * 1000,
+            "p99_ms": percentile(samples, 99) * 1000,
+            "max_ms": samples[-1] * 1000 if samples else 0.0,
+        })
+    requests = sum(s["ok"] + s["errors"] for s in steps)
+    return {
+        "users": users,
+        "flows": flows,
+        "concurrency": concurrency,
+        "wall_sec": elapsed,
+        "failed_flows": failed_flows[0],
+        "flows_per_sec": (flows - failed_flows[0]) / elapsed if elapsed else 0.0,
+        "req_per_sec": requests / elapsed if elapsed else 0.0,
+        "steps": steps,
+    }
+
+def print_report(report):
+    print(f"\n=== {report['flows']} flows, {report['users']} users, concurrency {report['concurrency']} ===")
+    print(f"{'step':<32} {'ok':>7} {'err':>5} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for s in report["steps"]:
+        print(f"{s['name']:<32} {s['ok']:>7} {s['errors']:>5} {s['req_per_sec']:>9.1f} "
+              f"{s['p50_ms']:>9.3f} {s['p95_ms']:>9.3f} {s['p99_ms']:>9.3f}")
+    print(f"\n[*] {report['flows_per_sec']:.1f} flows/s, {report['req_per_sec']:.1f} requests/s "
+          f"over {report['wall_sec']:.2f}s ({report['failed_flows']} failed flows)")
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end auth flow load generator for standalone.py")
+    parser.add_argument("--url", default=None, help="Target an already running server instead of starting one")
+    parser.add_argument("--port", type=int, default=4590, help="Port for the spawned server (default: 4590)")
+    parser.add_argument("-c", "--concurrency", type=int, default=8, help="Concurrent clients (default: 8)")
+    parser.add_argument("-u", "--users", type=int, default=32, help="Distinct usernames to cycle through (default: 32)")
+    parser.add_argument("-n", "--flows", type=int, default=500, help="Join flows to run (default: 500)")
+    parser.add_argument("--warmup", type=int, default=None, help="Untimed flows run first (default: one per user)")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Per-request timeout in seconds (default: 10)")
+    parser.add_argument("--backend", default=None, help="Signing backend for the spawned server")
+    parser.add_argument("--server-mode", default=None, help="Server mode for the spawned server: threaded or asyncio")
+    parser.add_argument("--verbose", action="store_true", help="Show the spawned server's output")
+    parser.add_argument("--json", dest="json_out", default=None, help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    server = None
+    workdir = None
+    if args.url:
+        parsed = urllib.parse.urlsplit(args.url)
+        host, port = parsed.hostname, parsed.port or 80
+    else:
+        host, port = "localhost", args.port
+        if args.backend:
+            os.environ["HYTALE_SIGNING_BACKEND"] = args.backend
+        if args.server_mode:
+            os.environ["HYTALE_SERVER_MODE"] = args.server_mode
+        # Keep the emulator's launcher/ files away from the real ones
+        workdir = tempfile.TemporaryDirectory(prefix="hytale-loadgen-")
+        print(f"[*] Starting standalone.py on port {port}...")
+        server = start_server(port, workdir.name, args.verbose)
+
+    try:
+        if not wait_for_server(host, port, 15):
+            print(f"[!] No server answering on {host}:{port}")
+            sys.exit(1)
+
+        warmup = args.users if args.warmup is None else args.warmup
+        if warmup:
+            print(f"[*] Warming up with {warmup} flows...")
+            run_load(host, port, args.users, warmup, args.concurrency, args.timeout)
+
+        print(f"[*] Running {args.flows} flows...")
+        report = run_load(host, port, args.users, args.flows, args.concurrency, args.timeout)
+        report["python"] = sys.version.split()[0]
+        report["target"] = f"{host}:{port}"
+        print_report(report)
+
+        if args.json_out:
+            with open(args.json_out, "w") as f:
+                json.dump(report, f, indent=2)
+            print(f"\n[+] Results written to {args.json_out}")
+    finally:
+        if server:
+            server.terminate()
+            try:
+                server.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                server.kill()
+        if workdir:
+            workdir.cleanup()
+
+if __name__ == "__main__":
+    main()
@@ -29,6 +29,6 @@ echo [+] Python ready
 
 REM Start the standalone.py server (handles UI and client launch)
 echo [*] Starting Hytale...
-"!PYTHON_CMD!" "!LAUNCHER_DIR!\standalone.py"
+"!PYTHON_CMD!" "!LAUNCHER_DIR!\standalone.py" %*
 
 exit /b 0
\ No newline at end of file
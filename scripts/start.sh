@@ -28,6 +28,6 @@ fi
 
 echo "[*] Starting Hytale..."
 # Start the standalone.py server
-$PYTHON_CMD "$LAUNCHER_DIR/standalone.py"
+$PYTHON_CMD "$LAUNCHER_DIR/standalone.py" "$@"
 
 exit 0
@@ -0,0 +1,113 @@
+import http.client
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+class KeepAliveTest(unittest.TestCase):
+    """
+    Idle keep-alive connections must not hold the threaded server's workers.
+    """
+    WORKERS = 2
+
+    @classmethod
+    def setUpClass(cls):
+        cls.cwd = os.getcwd()
+        cls.workdir = tempfile.TemporaryDirectory(prefix="hytale-test-")
+        os.chdir(cls.workdir.name)
+        import standalone
+        cls.standalone = standalone
+        cls.server = standalone.ThreadPoolHTTPServer(("localhost", 0), standalone.HytaleHandler, workers=cls.WORKERS)
+        cls.port = cls.server.server_address[1]
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        os.chdir(cls.cwd)
+        cls.workdir.cleanup()
+
+    def get(self, conn):
+        conn.request("GET", "/launcher/info")
+        resp = conn.getresponse()
+        resp.read()
+        return resp
+
+    def test_idle_clients_do_not_block_new_requests(self):
+        idle = []
+        try:
+            for _ in range(self.WORKERS + 1):
+                conn = http.client.HTTPConnection("localhost", self.port, timeout=10)
+                self.assertEqual(self.get(conn).status, 200)
+                idle.append(conn)
+
+            start = time.perf_counter()
+            fresh = http.client.HTTPConnection("localhost", self.port, timeout=10)
+            self.assertEqual(self.get(fresh).status, 200)
+            fresh.close()
+            self.assertLess(time.perf_counter() - start, 1.0)
+
+            # The parked connections are still served when they come back
+            for conn in idle:
+                resp = self.get(conn)
+                self.assertEqual(resp.status, 200)
+                self.assertFalse(resp.will_close)
+        finally:
+            for conn in idle:
+                conn.close()
+
+    def test_idle_connections_expire(self):
+        old_timeout = self.standalone.KEEPALIVE_TIMEOUT
+        self.standalone.KEEPALIVE_TIMEOUT = 0.3
+        try:
+            conn = http.client.HTTPConnection("localhost", self.port, timeout=10)
+            self.get(conn)
+            time.sleep(1.0)
+            self.assertEqual(conn.sock.recv(1), b"")
+            conn.close()
+        finally:
+            self.standalone.KEEPALIVE_TIMEOUT = old_timeout
+
+class SingleThreadedTest(unittest.TestCase):
+    """
+    The single-threaded TCPServer can't park connections, so it must not
+    keep them alive either.
+    """
+    def test_connections_close_after_each_response(self):
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory(prefix="hytale-test-") as workdir:
+            os.chdir(workdir)
+            try:
+                import standalone
+                server = standalone.socketserver.TCPServer(("localhost", 0), standalone.HytaleHandler)
+                thread = threading.Thread(target=server.serve_forever, daemon=True)
+                thread.start()
+                try:
+                    port = server.server_address[1]
+                    idle = http.client.HTTPConnection("localhost", port, timeout=10)
+                    idle.request("GET", "/launcher/info")
+                    resp = idle.getresponse()
+                    resp.read()
+                    self.assertTrue(resp.will_close)
+
+                    start = time.perf_counter()
+                    fresh = http.client.HTTPConnection("localhost", port, timeout=10)
+                    fresh.request("GET", "/launcher/info")
+                    self.assertEqual(fresh.getresponse().status, 200)
+                    self.assertLess(time.perf_counter() - start, 1.0)
+                    fresh.close()
+                    idle.close()
+                finally:
+                    server.shutdown()
+                    server.server_close()
+            finally:
+                os.chdir(cwd)
+
+if __name__ == "__main__":
+    unittest.main()
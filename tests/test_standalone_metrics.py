@@ -0,0 +1,59 @@
+import http.client
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+class MetricsTest(unittest.TestCase):
+    """
+    A request whose handler raises gets a 500 and must not break /metrics.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.cwd = os.getcwd()
+        cls.workdir = tempfile.TemporaryDirectory(prefix="hytale-test-")
+        os.chdir(cls.workdir.name)
+        import standalone
+        cls.standalone = standalone
+        cls.server = standalone.ThreadPoolHTTPServer(("localhost", 0), standalone.HytaleHandler, workers=2)
+        cls.port = cls.server.server_address[1]
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        os.chdir(cls.cwd)
+        cls.workdir.cleanup()
+
+    def request(self, method, path, body=None, token=None):
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        conn = http.client.HTTPConnection("localhost", self.port, timeout=30)
+        try:
+            conn.request(method, path, body=json.dumps(body) if body is not None else None, headers=headers)
+            resp = conn.getresponse()
+            return resp, resp.read()
+        finally:
+            conn.close()
+
+    def test_scrape_after_failed_request(self):
+        resp, raw = self.request("POST", "/launcher/login", {"username": "MetricsUser"})
+        self.assertEqual(resp.status, 200)
+        token = json.loads(raw)["access_token"]
+
+        resp, _ = self.request("POST", "/game-session/child", {"scopes": 5}, token)
+        self.assertEqual(resp.status, 500)
+        self.assertEqual(resp.getheader("Connection"), "close")
+
+        for _ in range(2):
+            resp, raw = self.request("GET", "/metrics")
+            self.assertEqual(resp.status, 200)
+            self.assertIn(b'route="/game-session/child",status="500"', raw)
+
+if __name__ == "__main__":
+    unittest.main()